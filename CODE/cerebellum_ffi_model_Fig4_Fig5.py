@@ -13,33 +13,61 @@ and have short-term facilitation and short-term-depression (Tsodyka-Markram Syna
 Stimulus inputs are presented using the device spike_generator. it is connected to the
 neuron via Parrot neuron in order to vary the synaptic strengths
 
+The network itself is built in mfdeltalat/model.py, this script runs the parameter sweep
+(the repository folder must be on the PYTHONPATH)
+
 Free variables: 
 1. Short-term dynamics of synapses A and U for both excitatory and inhibitory synapses
 2. Number of stimulus pulse [e..g 1, 2,...] stim_count
 3. Interval between stimulus pulses stim_freq
 4. Delay between excitation and inhibition arriving at the PC ei_delay
 
-The data will be save in the .dat [membrane potential] and .gdf files [spiking activity]. 
+The no_trial trials are simulated in blocks of trial_block neurons (the kernel is reset between blocks),
+so that the simulation time grows linearly with no_trial. The spikes of each block are read from memory 
+and fed to streaming accumulators (mfdeltalat.trials.TrialStats), which do not grow with the number of trials:
+- mean and variance (Welford) of the spike count per trial in the baseline window [stim_start-resp_win, stim_start),
+  in the response window [stim_start, stim_start+resp_win) and of their difference
+- PSTH with fixed psth_bin bins
+- histogram of the first spike latency after stimulus onset
+
+With adaptive = True the number of trials is chosen per configuration: blocks are simulated until the
+half-width of the confidence interval on the mean of adapt_metric (by default the change in spike count
+between response and baseline windows) is below ci_precision, or until max_trial trials were simulated.
+The number of trials used for each configuration is appended to trial_log.
+
+The statistics of each configuration are saved in f_name + '_stats.npz'. You can load them using e.g.
+xx = np.load('file_name_stats.npz')
+
+and diplay the PSTH as
+plt.bar(xx['psth_edges'][:-1],xx['psth']/(xx['no_trial']*xx['psth_bin']*1e-3),width=xx['psth_bin'],align='edge') # rate in Hz
+
+With save_spikes = True the full spike list is also saved in .gdf files (one per block). 
 You can load the .gdf file using e.g.
 xx = np.loadtxt('file_name.gdf')
 
 and diplay the data as
 plt.plot(xx[:,1],xx[:,0],'.') # this will render each trial as a row of dots
 
-You can load the .dat file using e.g.
-xx = np.loadtxt('file_name.dat')
+Optionally (record_vm = True) the membrane potential of the first vm_no_trial trials is recorded
+with a voltmeter, only in a window around the stimulus and every vm_interval ms. 
+Instead of NEST's text .dat files, the samples of all configurations are appended to a single 
+float32 binary file (vm_store + '.bin') and the position of each configuration is kept in an 
+index file (vm_store + '.idx'). You can load the traces of one configuration using e.g.
+from mfdeltalat.vmstore import load_vm
+vm, t = load_vm('./data/vm_traces', f_name)
 
 and diplay the data as
-plt.plot(xx[:,1],xx[:,2],'.') # this will render each trial as a row of dots
+plt.plot(t,vm.T) # this will render each trial as a trace
 
 @ Arvind Kumar, KTH, Stockholm, Sweden. 2022
 
 '''
-import nest
 import numpy as np
 
 import os.path
 
+from mfdeltalat.model import stim_times, run_configuration
+
 # Parameter ranges for Ae, Ue, Ai, Ui, stim freq, stim count and ei_delay
 # STD parameters
 Ue = np.array((0.02,0.03,0.05,0.07,0.1,0.2,0.3,0.4))
@@ -64,135 +92,67 @@ stim_freq = [10]
 ei_delay = [0.] 
 stim_count = [5]
 
-####################### These parameters are fixed for neurons and for synapses
-# Intrinsic properties -- capacitance, baseline activity etc.
-intrinsic_param = dict({'ei_delay': 1.,'poi_rate':900.,'gamma_rate':2000.,'gamma_freq':157.,'gamma_ac':10.,'Tau_Syn_Inh':5.0,'Cm':250.})
-exc_weight = dict({'Tau_psc': 1.5, 'Tau_rec':30.,'Tau_fac': 500., 'U': 0.015, 'A':100.})
-inh_weight = dict({'Tau_psc': 1.5, 'Tau_rec':100.,'Tau_fac': 800., 'U': 0.4,  'A':-3.1})
-#######################
+# Neuron, synapse and background parameters are fixed in mfdeltalat/model.py
 
-sim_time = 1200
 no_trial = 200 # this will translate to number of neurons -- each neuron is one trial
-
-# Synapses
-Je_ext = 1.0/2. # will give 0.2 mV @-55mV
+trial_block = 200 # number of neurons (trials) simulated together, the kernel is reset between blocks
+master_seed = 12345 # each block gets its own NEST seeds, derived from this one
+save_spikes = False # set to True to also save the full spike list (.gdf)
+
+# Adaptive number of trials -- no_trial is then ignored
+adaptive = False # set to True to stop each configuration once the estimate is precise enough
+adapt_metric = 'delta' # 'delta' (response - baseline spike count), 'resp' or 'base'
+ci_z = 1.96 # 95% confidence interval
+ci_precision = 0.05 # stop when the CI half-width on the mean of adapt_metric is below this [spikes]
+min_trial = 400
+max_trial = 20000
+trial_log = './data/trial_counts.txt' # f_name, trials, mean and CI half-width of adapt_metric
+
+# Streaming statistics
+resp_win = 100. # length of the baseline and response windows [ms]
+psth_bin = 5. # [ms]
+lat_bin = 0.5 # first spike latency histogram [ms]
+lat_max = 100.
+
+######### Membrane potential recording (optional) ###############
+record_vm = False # set to True to attach a voltmeter to a subset of trials
+vm_no_trial = 20 # number of trials (neurons) whose Vm is recorded
+vm_interval = 0.5 # sampling interval in ms (multiple of the 0.1 ms resolution)
+vm_pre = 50. # the window starts vm_pre ms before the first stimulus
+vm_post = 150. # ... and ends vm_post ms after the last one
+vm_store = './data/vm_traces' # -> vm_traces.bin and vm_traces.idx
 
 stim_start = 200.
 
+vm = dict(no_trial=vm_no_trial, interval=vm_interval, pre=vm_pre, post=vm_post) if record_vm else None
+
 for k1 in range(len(stim_freq)): # frequency
-    stim_interval  = np.round((1000./stim_freq[k1])*10.)/10.
     for k2 in range(len(ei_delay)): # EI delay
         for k3 in range(len(stim_count)): # number of spikes
-            if stim_count[k3]>0:
-                test_spk_time = np.zeros(stim_count[k3])
-                for ii in range(stim_count[k3]): # create the spike train
-                    test_spk_time[ii] = stim_start+stim_interval*ii
-            else:
-                test_spk_time = np.zeros(1)
-                test_spk_time[0] = 500.
-            
-            gran_cell_stim = test_spk_time
-            interneuron_stim= gran_cell_stim + ei_delay[k2]
+            gran_cell_stim, interneuron_stim = stim_times(stim_freq[k1], ei_delay[k2], stim_count[k3], stim_start)
             print('Exc:',gran_cell_stim,'Inh:',interneuron_stim)
             
-            # Set the base parameters
-            ii = 0 # kx+1
-            Tau_Syn_Inh = intrinsic_param['Tau_Syn_Inh']
-            Cm = intrinsic_param['Cm']
-            neuron_params = {'V_th':-55.0, 'V_reset': -70.0, 't_ref': 2.0, 'g_L':13.5,'C_m':Cm, 'E_ex': 0.0, 'E_in': -80.0, 'tau_syn_ex':1.,'tau_syn_in': Tau_Syn_Inh,'E_L' : -70.}
-
-            gamma_rate = intrinsic_param['gamma_rate']
-            gamma_freq = intrinsic_param['gamma_freq']
-            gamma_ac = intrinsic_param['gamma_ac']
-            poi_rate = intrinsic_param['poi_rate']
-            
             for a1 in range(len(Ue)):
                 for a2 in range(len(Ae)):
                     for a3 in range(len(Ui)):
                         for a4 in range(len(Ai)):
                             # synapses
-                            Tau_psc_I = inh_weight['Tau_psc']     # time constant of PSC (= Tau_inact)
-                            Tau_rec_I = inh_weight['Tau_rec']   # recovery time
-                            Tau_fac_I = inh_weight['Tau_fac']     # facilitation time
-                            U_I       = Ui[a3]    # facilitation parameter U
                             A_I       = -Ai[a4]/Ui[a3]   # PSC weight in pA # 1.6640
-                            A_I_add   = A_I * 1.5
-                            
-                            Tau_psc_E = exc_weight['Tau_psc']    # time constant of PSC (= Tau_inact)
-                            Tau_rec_E = exc_weight['Tau_rec']   # recovery time
-                            Tau_fac_E = exc_weight['Tau_fac']   # facilitation time
-                            U_E       = Ue[a1]   # facilitation parameter U
                             A_E       = Ae[a2]/Ue[a1]  # PSC weight in pA -- -0.3420mV
-                            # File names to save the mem. traces
+                            # File names to save the results
                             f_name = 'neuron_' + 'Ue_' + str(a1) + '_' + 'Ae_' + str(a2) + '_' + 'Ui_' + str(a3) + '_' + 'Ai_' + str(a4) + '_freq_' + str(stim_freq[k1]) + '_delay_' + str(ei_delay[k2]) + '_count_' + str(stim_count[k3])
-                            #f_name = 'neuron' + '_freq_' + str(stim_freq[k1]) + '_delay_' + str(ei_delay[k2]) + '_count_' + str(stim_count[k3])
-                            fx = './data/' +f_name + '-107-0.gdf'
+                            fx = './data/' +f_name + '_stats.npz'
 
                             if os.path.isfile(fx)==0:
-                                nest.ResetKernel()
-                                nest.SetStatus([0],{'data_path':'./data','overwrite_files': True})
-
-                                # create neuron and parrots
-                                pur = nest.Create('iaf_cond_alpha', no_trial,neuron_params)
-                                #set mempot to a random value
-                                v1 = np.random.uniform(low=-70.,high=-58.,size=no_trial)
-                                vinit = [{'V_m': nid} for nid in v1]
-                                nest.SetStatus(pur,vinit)
-                                
-                                parrot_ex = nest.Create('parrot_neuron',1)
-                                parrot_in = nest.Create('parrot_neuron',1)
-                                
-                                # Spike detectors
-                                sd = nest.Create('spike_detector',1)
-                                nest.SetStatus(sd,{'label':f_name,'to_file':True,'to_memory':False})
-
-                                # Poisson Generator
-                                poi = nest.Create('poisson_generator',1,{'rate':poi_rate})
-                                # Gamma generator -- for quasi-periodic inputs
-                                gamma_stim = nest.Create('sinusoidal_gamma_generator', n=1,params=[{'rate': gamma_rate, 'amplitude': gamma_ac, 'frequency': gamma_freq, 'phase': 0.0, 'order': 4.0}])
-
-                                # Create spike generators and connect
-                                gex = nest.Create('spike_generator', params = {'spike_times': gran_cell_stim.tolist()})
-                                gin = nest.Create('spike_generator', params = {'spike_times':interneuron_stim.tolist()})
-
-                                nest.Connect(gex,parrot_ex)
-                                nest.Connect(gin,parrot_in)
-
-                                # set synapse parameters:
-                                syn_param_exc = {"tau_psc" :  Tau_psc_E,
-                                "tau_rec" :  Tau_rec_E,
-                                "tau_fac" :  Tau_fac_E,
-                                "U"       :  U_E,
-                                "delay"   :  0.1,
-                                "weight"  :  A_E,
-                                "u"       :  0.0,
-                                "x"       :  1.0}
-
-                                syn_param_inh = {"tau_psc" :  Tau_psc_I,
-                                "tau_rec" :  Tau_rec_I,
-                                "tau_fac" :  Tau_fac_I,
-                                "U"       :  U_I,
-                                "delay"   :  0.1,
-                                "weight"  :  A_I,
-                                "u"       :  0.0,
-                                "x"       :  1.0}
-
-                                syn_param_static = {'weight':Je_ext,'delay':1.0}
-
-                                nest.CopyModel("tsodyks_synapse","syn_exc",syn_param_exc)
-                                nest.CopyModel("tsodyks_synapse","syn_inh",syn_param_inh)
-                                nest.CopyModel("static_synapse","syn_static",syn_param_static)
-
-                                nest.Connect(parrot_ex, pur, syn_spec={'model':'syn_exc'}) #4.5,1.) # Exc Facil
-                                nest.Connect(parrot_in, pur, syn_spec={'model':'syn_inh'}) #4.5,1.) # Inh Dep
-
-                                nest.Connect(gamma_stim,pur,syn_spec={'model':'syn_static'}) # exc static
-                                nest.Connect(poi,pur,syn_spec={'model':'syn_static'}) # exc static
-
-                                nest.Connect(pur,sd)
-                                # simulate
-                                sim_time = interneuron_stim[-1] + 300.
-                                conn3 = nest.GetConnections(parrot_in)
-                                nest.SetStatus(conn3, {"weight": A_I_add})
-                                nest.Simulate(sim_time)
-                                
+                                stats = run_configuration(f_name, gran_cell_stim, interneuron_stim, Ue[a1], A_E, Ui[a3], A_I,
+                                                          no_trial=no_trial, trial_block=trial_block, master_seed=master_seed, save_spikes=save_spikes,
+                                                          adaptive=adaptive, adapt_metric=adapt_metric, ci_z=ci_z, ci_precision=ci_precision,
+                                                          min_trial=min_trial, max_trial=max_trial,
+                                                          stim_start=stim_start, resp_win=resp_win, psth_bin=psth_bin, lat_bin=lat_bin, lat_max=lat_max,
+                                                          vm=vm, vm_store=vm_store)
+                                stats.save(fx)
+                                if adaptive:
+                                    metric = getattr(stats, adapt_metric)
+                                    print(f_name, 'trials:', stats.no_trial, adapt_metric + ':', metric.mean, '+/-', metric.ci(ci_z))
+                                    with open(trial_log, 'a') as fl:
+                                        fl.write('%s %d %g %g\n' % (f_name, stats.no_trial, metric.mean, metric.ci(ci_z)))
@@ -0,0 +1,23 @@
+'''
+Code of Binda, Spaeth et al. -- Effect of excitation and inhibition delay in a feedforward 
+inhibitory pathway on mice cerebellar Purkinje cell output
+
+The submodules are only imported when first used (e.g. mfdeltalat.model), and import their 
+heavy dependencies inside the functions that need them, so that a simulation worker never 
+loads matplotlib/seaborn and an analysis run never loads nest:
+model    : NEST model of the feedforward inhibitory network (nest)
+trials   : streaming statistics over trials
+vmstore  : float32 binary store of membrane potential traces
+data     : loading of the SOURCE_DATA workbooks (pandas)
+stats    : statistical tests and linear fits (scipy, electroPyy)
+plotting : figures (matplotlib, seaborn)
+build    : incremental rebuild of the figures
+'''
+import importlib
+
+__all__ = ['model', 'trials', 'vmstore', 'data', 'stats', 'plotting', 'build']
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
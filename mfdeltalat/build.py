@@ -0,0 +1,282 @@
+'''
+Incremental rebuild of the figures of the paper, run with
+python -m mfdeltalat.build SOURCE_DATA_DIR [--sweep ./data] [--out ./figures] [target ...]
+
+Each target (intermediate table or figure) lists its input files, the targets it depends on and
+its recipe. Its key is a hash of the content of the input files, of the keys of its dependencies
+and of its code: the recipe, and every function (or constant) of data, stats, plotting and Build
+whose name appears in it, followed recursively. A target is only made again when its key changed:
+unchanged tables are loaded from the cache (out/.cache) and unchanged figures are left as they are.
+The sweep table is also cached row by row, so that only the new or changed slices of the sweep
+are read again.
+'''
+import argparse
+import glob
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import traceback
+
+# name -> kind, input files, targets it depends on, recipe
+targets = {
+    'latencies': dict(kind='table', deps=[],
+                      inputs=lambda b: [b.source('MossyFibersSpikeLatencies.xlsx')],
+                      make=lambda b: b.module('data').mossy_fiber_latencies(b.mainDataDir)),
+    'protocol': dict(kind='table', deps=[],
+                     inputs=lambda b: [b.source('Single_Protocol_ProcessedData.xlsx'), b.source('Surface_Protocol_ProcessedData.xlsx')],
+                     make=lambda b: b.module('data').protocol_data(b.mainDataDir)),
+    'sweep': dict(kind='table', deps=[],
+                  inputs=lambda b: sorted(glob.glob(os.path.join(b.sweepDir, '*_stats.npz'))),
+                  make=lambda b: b.sweep_table()),
+    'Fig_1D': dict(kind='figure', deps=['latencies'], inputs=lambda b: [],
+                   make=lambda b, latencies: b.module('plotting').fig_1d(latencies)),
+    'Fig_1E': dict(kind='figure', deps=['protocol'], inputs=lambda b: [],
+                   make=lambda b, protocol: b.module('plotting').fig_1e(*protocol)),
+    'Fig_2AB_3ABCD': dict(kind='figure', deps=['protocol'], inputs=lambda b: [],
+                          make=lambda b, protocol: b.module('plotting').fig_2ab_3abcd(*protocol)),
+    'Fig_2G': dict(kind='figure', deps=[], inputs=lambda b: [],
+                   make=lambda b: b.module('plotting').fig_2g(b.module('data').group_counts['single'],
+                                                              b.module('data').group_counts['surface'],
+                                                              b.module('data').group_labels)),
+    # summary of the NEST sweep, not a panel of the paper (Fig 4/5)
+    'Sweep_delta_vs_delay': dict(kind='figure', deps=['sweep'], inputs=lambda b: [],
+                                 make=lambda b, sweep: b.module('plotting').sweep_delta_vs_delay(sweep)),
+}
+
+# modules whose functions the recipes may use
+code_modules = ['data', 'stats', 'plotting']
+
+def _names(code):
+    '''
+    Global and attribute names used in a code object, and in the functions/lambdas nested in it
+    '''
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _names(const)
+    return names
+
+class Build:
+    '''
+    Keys of the targets and content hashes of the files are kept in out/.cache/manifest.json
+    (a file is only hashed again when its size or modification time changed)
+    '''
+    def __init__(self, mainDataDir, sweepDir='./data', outDir='./figures'):
+        self.mainDataDir = mainDataDir
+        self.sweepDir = sweepDir
+        self.outDir = outDir
+        self.cacheDir = os.path.join(outDir, '.cache')
+        os.makedirs(self.cacheDir, exist_ok=True)
+
+        self.manifest = {'files': {}, 'targets': {}}
+        if os.path.isfile(self.manifest_file):
+            with open(self.manifest_file) as f:
+                self.manifest = json.load(f)
+        self.keys = {}
+        self.values = {}
+        self.failed = set()
+
+    @property
+    def manifest_file(self):
+        return os.path.join(self.cacheDir, 'manifest.json')
+
+    def source(self, fname):
+        return os.path.join(self.mainDataDir, fname)
+
+    def module(self, name):
+        return importlib.import_module('.' + name, __package__)
+
+    def file_hash(self, path):
+        st = os.stat(path)
+        cached = self.manifest['files'].get(path)
+        if cached is not None and cached[:2] == [st.st_size, st.st_mtime_ns]:
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        self.manifest['files'][path] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def code_hash(self, name):
+        module, attr = name.split('.')
+        obj = getattr(self.module(module), attr)
+        return inspect.getsource(obj) if callable(obj) else repr(obj)
+
+    def code(self, func):
+        '''
+        Source of func and of the functions and constants it may use -> dict name: source
+        Every name in the code of func that is a function or a constant of data, stats, plotting,
+        or a method of Build, is taken (over-approximated: a name shared by two modules takes both)
+        '''
+        found = {}
+        todo = [func]
+        while todo:
+            f = todo.pop()
+            for name in _names(f.__code__):
+                if name.startswith('__'):
+                    continue
+                for owner, space in [('Build', Build)] + [(m, self.module(m)) for m in code_modules]:
+                    obj = getattr(space, name, None)
+                    key = owner + '.' + name
+                    if key in found:
+                        continue
+                    if inspect.isfunction(obj):
+                        found[key] = inspect.getsource(obj)
+                        todo.append(obj)
+                    elif owner != 'Build' and isinstance(obj, (list, tuple, dict, str, int, float)):
+                        found[key] = repr(obj)
+        return found
+
+    def key(self, name):
+        if name not in self.keys:
+            t = targets[name]
+            h = hashlib.sha256(name.encode())
+            for path in t['inputs'](self):
+                h.update((path + self.file_hash(path)).encode())
+            for dep in t['deps']:
+                h.update(self.key(dep).encode())
+            h.update(inspect.getsource(t['make']).encode())
+            h.update(inspect.getsource(Build.make).encode())
+            for code, src in sorted(self.code(t['make']).items()):
+                h.update((code + src).encode())
+            self.keys[name] = h.hexdigest()
+        return self.keys[name]
+
+    def up_to_date(self, name):
+        entry = self.manifest['targets'].get(name)
+        return entry is not None and entry['key'] == self.key(name) and all(os.path.isfile(f) for f in entry['outputs'])
+
+    def table_file(self, name):
+        return os.path.join(self.cacheDir, name + '.pkl')
+
+    def value(self, name):
+        '''
+        Value of a table -- from the cache if it is up to date, made again otherwise
+        '''
+        if name not in self.values:
+            if self.up_to_date(name):
+                with open(self.table_file(name), 'rb') as f:
+                    self.values[name] = pickle.load(f)
+            else:
+                self.make(name)
+        return self.values[name]
+
+    def depends_on(self, name, others):
+        '''
+        True if name is one of others or depends (directly or not) on one of them
+        '''
+        return name in others or any(self.depends_on(dep, others) for dep in targets[name]['deps'])
+
+    def make(self, name):
+        t = targets[name]
+        try:
+            result = t['make'](self, *[self.value(dep) for dep in t['deps']])
+        except Exception:
+            if not any(self.depends_on(dep, self.failed) for dep in t['deps']):
+                self.failed.add(name) # only the first target that failed is reported
+            raise
+
+        if t['kind'] == 'table':
+            outputs = [self.table_file(name)]
+            with open(outputs[0], 'wb') as f:
+                pickle.dump(result, f)
+            self.values[name] = result
+        else:
+            plt = self.module('plotting').pyplot()
+            figs = result if isinstance(result, list) else [result]
+            if len(figs) == 1:
+                outputs = [os.path.join(self.outDir, name + '.pdf')]
+            else:
+                outputs = [os.path.join(self.outDir, '{}_{}.pdf'.format(name, k)) for k in range(len(figs))]
+            for fig, fname in zip(figs, outputs):
+                fig.savefig(fname)
+                plt.close(fig)
+
+        self.manifest['targets'][name] = {'key': self.key(name), 'outputs': outputs}
+        self.save_manifest()
+        print('{:22s} rebuilt'.format(name))
+
+    def save_manifest(self):
+        with open(self.manifest_file, 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+
+    def sweep_table(self):
+        '''
+        Sweep table, only reading the result files whose content changed since the last build
+        (all of them are read again when the code of data.sweep_row changed)
+        '''
+        data = self.module('data')
+        code = self.code_hash('data.sweep_row')
+        cache_file = os.path.join(self.cacheDir, 'sweep_rows.pkl')
+        rows = {}
+        if os.path.isfile(cache_file):
+            with open(cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            if isinstance(cache, dict) and cache.get('code') == code:
+                rows = cache['rows']
+
+        new_rows = {}
+        for path in targets['sweep']['inputs'](self):
+            sha = self.file_hash(path)
+            if path in rows and rows[path][0] == sha:
+                new_rows[path] = rows[path]
+            else:
+                new_rows[path] = (sha, data.sweep_row(path))
+
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'code': code, 'rows': new_rows}, f)
+        return data.sweep_table([row for sha, row in new_rows.values()])
+
+    def run(self, names=None):
+        '''
+        Make the figures in names (all of them by default) whose key changed
+        A target that fails is reported, and the targets that depend on it are skipped
+        returns the names of the targets that failed
+        '''
+        if names is None:
+            names = [name for name in targets if targets[name]['kind'] == 'figure']
+        unknown = [name for name in names if name not in targets]
+        if unknown:
+            raise ValueError('unknown target(s) {} -- valid targets are {}'.format(', '.join(unknown), ', '.join(targets)))
+        for name in names:
+            empty = [dep for dep in targets[name]['deps'] if targets[dep]['kind'] == 'table' and not targets[dep]['inputs'](self)]
+            if empty:
+                print('{:22s} skipped, no input files for {}'.format(name, ', '.join(empty)))
+            elif self.depends_on(name, self.failed):
+                print('{:22s} skipped, depends on {}'.format(name, ', '.join(f for f in self.failed if self.depends_on(name, {f}))))
+            else:
+                try:
+                    if self.up_to_date(name):
+                        print('{:22s} up to date'.format(name))
+                    else:
+                        self.make(name)
+                except Exception:
+                    failed = [f for f in self.failed if self.depends_on(name, {f})]
+                    if not failed: # e.g. a missing input file
+                        self.failed.add(name)
+                        failed = [name]
+                    print('{:22s} FAILED in {}'.format(name, ', '.join(failed)))
+                    traceback.print_exc()
+        self.save_manifest()
+        return sorted(self.failed)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild the figures whose data or code changed')
+    parser.add_argument('mainDataDir', help='location of the SOURCE_DATA folder')
+    parser.add_argument('targets', nargs='*', help='targets to build (default: all figures) -- ' + ', '.join(targets))
+    parser.add_argument('--sweep', default='./data', help='folder of the *_stats.npz files of the NEST sweep')
+    parser.add_argument('--out', default='./figures', help='folder of the figures')
+    args = parser.parse_intermixed_args()
+    unknown = [name for name in args.targets if name not in targets]
+    if unknown:
+        parser.error('unknown target(s) {} -- valid targets are {}'.format(', '.join(unknown), ', '.join(targets)))
+
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    failed = Build(args.mainDataDir, args.sweep, args.out).run(args.targets or None)
+    sys.exit(1 if failed else 0)
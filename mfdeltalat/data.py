@@ -0,0 +1,60 @@
+'''
+Loading of the SOURCE_DATA workbooks and of the results of the sweep
+
+pandas is only imported when a table is made
+'''
+import os.path
+import re
+
+import numpy as np
+
+def sheet_names(fname):
+    import pandas as pd
+    return pd.ExcelFile(fname).sheet_names
+
+def read_sheet(fname, sheet_name=0):
+    import pandas as pd
+    return pd.read_excel(fname, header=0, index_col=0, sheet_name=sheet_name)
+
+def mossy_fiber_latencies(mainDataDir):
+    '''
+    Spike latencies of each rosette (one sheet per rosette) -> dict sheet: DataFrame
+    '''
+    fname = '{}/MossyFibersSpikeLatencies.xlsx'.format(mainDataDir)
+    return {sheet: read_sheet(fname, sheet) for sheet in sheet_names(fname)}
+
+def protocol_data(mainDataDir):
+    '''
+    Processed data of the single and surface protocols -> singleData, surfaceData
+    '''
+    singleData = read_sheet('{}/Single_Protocol_ProcessedData.xlsx'.format(mainDataDir))
+    surfaceData = read_sheet('{}/Surface_Protocol_ProcessedData.xlsx'.format(mainDataDir))
+    return singleData, surfaceData
+
+# Number of cells in each group (Fig 2G)
+group_labels = ['Group 1', 'Group 2 E first', 'Group 2 I first', 'Group 3']
+group_counts = {'single': [29,6,10,4], 'surface': [20,24,10,10]}
+
+def sweep_row(fname):
+    '''
+    Parameters (from the file name) and statistics of one configuration of the sweep
+    fname : f_name + '_stats.npz', as saved by CODE/cerebellum_ffi_model_Fig4_Fig5.py
+    '''
+    name = os.path.basename(fname)
+    m = re.match(r'neuron_Ue_(\d+)_Ae_(\d+)_Ui_(\d+)_Ai_(\d+)_freq_([^_]+)_delay_([^_]+)_count_(\d+)_stats\.npz$', name)
+    if m is None:
+        raise ValueError('not a sweep result: ' + name)
+
+    row = dict(zip(['Ue', 'Ae', 'Ui', 'Ai'], [int(x) for x in m.groups()[:4]]))
+    row.update(freq=float(m.group(5)), delay=float(m.group(6)), count=int(m.group(7)))
+    with np.load(fname) as xx:
+        for key in ['no_trial', 'base_mean', 'resp_mean', 'delta_mean', 'delta_var']:
+            row[key] = xx[key].item()
+    return row
+
+def sweep_table(rows):
+    '''
+    One row per configuration -> DataFrame
+    '''
+    import pandas as pd
+    return pd.DataFrame(rows)
@@ -0,0 +1,54 @@
+'''
+Import time check, run with
+python -m mfdeltalat.importcheck
+
+Each submodule is imported in a fresh interpreter, to check that it does not load any heavy 
+module (they are imported where used) and that its own import time stays below its budget. 
+numpy is imported before the timer starts: it is needed by the simulation anyway and would 
+hide the cost of the package itself. The best of a few runs is kept, to be robust to a loaded machine
+'''
+import os.path
+import subprocess
+import sys
+
+budget_ms = 15. # per module
+budget_ms_build = 40. # build also imports argparse, inspect, json, pickle, ...
+
+heavy = ['nest', 'pandas', 'scipy', 'matplotlib', 'seaborn', 'electroPyy']
+
+modules = ['mfdeltalat', 'mfdeltalat.model', 'mfdeltalat.trials', 'mfdeltalat.vmstore',
+           'mfdeltalat.data', 'mfdeltalat.stats', 'mfdeltalat.plotting', 'mfdeltalat.build']
+
+code = '''
+import sys, time
+import numpy
+t = time.perf_counter()
+import {}
+print((time.perf_counter() - t)*1000.)
+print(' '.join(m for m in {!r} if m in sys.modules))
+'''
+
+def budget(module):
+    return budget_ms_build if module == 'mfdeltalat.build' else budget_ms
+
+def check(module, repeat=3):
+    '''
+    returns the import time [ms] (best of repeat runs) and the heavy modules loaded by importing module
+    '''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times, loaded = [], set()
+    for k in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code.format(module, heavy)], cwd=root,
+                             capture_output=True, text=True, check=True).stdout.split('\n')
+        times.append(float(out[0]))
+        loaded.update(out[1].split())
+    return min(times), sorted(loaded)
+
+if __name__ == '__main__':
+    failed = False
+    for module in modules:
+        dt, loaded = check(module)
+        ok = dt <= budget(module) and not loaded
+        failed |= not ok
+        print('{:22s} {:6.1f} ms  {}  {}'.format(module, dt, 'ok  ' if ok else 'FAIL', ' '.join(loaded)))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,183 @@
+'''
+Simulation of a Feedforward Inhibitory Network using NEST 2.20
+
+All neurons are modelled as Integrate and fire unit
+
+To mimic Purkinje cell, the LIF neuron is driven with a Poisson type input and
+gamma process whose rate was varied in a sinusoidal fashion
+
+The synapses are modelled as conductance transient
+and have short-term facilitation and short-term-depression (Tsodyka-Markram Synapse)
+
+Stimulus inputs are presented using the device spike_generator. it is connected to the
+neuron via Parrot neuron in order to vary the synaptic strengths
+
+nest is only imported when a block of trials is simulated, the sweep itself is run by
+CODE/cerebellum_ffi_model_Fig4_Fig5.py
+
+@ Arvind Kumar, KTH, Stockholm, Sweden. 2022
+'''
+import numpy as np
+
+from .trials import TrialStats
+from .vmstore import save_vm
+
+####################### These parameters are fixed for neurons and for synapses
+# Intrinsic properties -- capacitance, baseline activity etc.
+intrinsic_param = dict({'ei_delay': 1.,'poi_rate':900.,'gamma_rate':2000.,'gamma_freq':157.,'gamma_ac':10.,'Tau_Syn_Inh':5.0,'Cm':250.})
+exc_weight = dict({'Tau_psc': 1.5, 'Tau_rec':30.,'Tau_fac': 500., 'U': 0.015, 'A':100.})
+inh_weight = dict({'Tau_psc': 1.5, 'Tau_rec':100.,'Tau_fac': 800., 'U': 0.4,  'A':-3.1})
+neuron_params = {'V_th':-55.0, 'V_reset': -70.0, 't_ref': 2.0, 'g_L':13.5,'C_m':intrinsic_param['Cm'], 'E_ex': 0.0, 'E_in': -80.0, 'tau_syn_ex':1.,'tau_syn_in': intrinsic_param['Tau_Syn_Inh'],'E_L' : -70.}
+#######################
+
+# Synapses
+Je_ext = 1.0/2. # will give 0.2 mV @-55mV
+
+def stim_times(stim_freq, ei_delay, stim_count, stim_start=200.):
+    '''
+    Spike times of the granule cell (excitation) and interneuron (inhibition) inputs
+    '''
+    stim_interval  = np.round((1000./stim_freq)*10.)/10.
+    if stim_count>0:
+        test_spk_time = stim_start + stim_interval*np.arange(stim_count)
+    else:
+        test_spk_time = np.zeros(1)
+        test_spk_time[0] = 500.
+
+    gran_cell_stim = test_spk_time
+    interneuron_stim = gran_cell_stim + ei_delay
+    return gran_cell_stim, interneuron_stim
+
+def simulate_block(n_block, gran_cell_stim, interneuron_stim, U_E, A_E, U_I, A_I, sim_time, master_seed, kb,
+                   label='neuron', save_spikes=False, data_path='./data', vm=None):
+    '''
+    Simulate n_block trials (one iaf_cond_alpha neuron per trial) of one configuration
+    A_E, A_I : PSC weights in pA
+    master_seed, kb : the seeds of block kb are master_seed + kb*(n_vp+1) ... master_seed + kb*(n_vp+1) + n_vp
+    vm : None, or dict(no_trial, interval, pre, post) to record the Vm of the first vm['no_trial'] trials
+    returns the spike events, the multimeter events (or None) and the id of the first neuron
+    '''
+    import nest
+
+    nest.ResetKernel()
+    nest.SetStatus([0],{'data_path':data_path,'overwrite_files': True})
+    n_vp = nest.GetKernelStatus('total_num_virtual_procs')
+    seed = master_seed + kb*(n_vp+1)
+    nest.SetKernelStatus({'grng_seed': seed, 'rng_seeds': list(range(seed+1, seed+1+n_vp))})
+
+    # create neuron and parrots
+    pur = nest.Create('iaf_cond_alpha', n_block,neuron_params)
+    #set mempot to a random value
+    v1 = np.random.default_rng(seed).uniform(low=-70.,high=-58.,size=n_block)
+    vinit = [{'V_m': nid} for nid in v1]
+    nest.SetStatus(pur,vinit)
+
+    parrot_ex = nest.Create('parrot_neuron',1)
+    parrot_in = nest.Create('parrot_neuron',1)
+
+    # Spike detectors
+    sd = nest.Create('spike_detector',1)
+    nest.SetStatus(sd,{'label':label,'to_file':save_spikes,'to_memory':True})
+
+    # Poisson Generator
+    poi = nest.Create('poisson_generator',1,{'rate':intrinsic_param['poi_rate']})
+    # Gamma generator -- for quasi-periodic inputs
+    gamma_stim = nest.Create('sinusoidal_gamma_generator', n=1,params=[{'rate': intrinsic_param['gamma_rate'], 'amplitude': intrinsic_param['gamma_ac'], 'frequency': intrinsic_param['gamma_freq'], 'phase': 0.0, 'order': 4.0}])
+
+    # Create spike generators and connect
+    gex = nest.Create('spike_generator', params = {'spike_times': gran_cell_stim.tolist()})
+    gin = nest.Create('spike_generator', params = {'spike_times':interneuron_stim.tolist()})
+
+    nest.Connect(gex,parrot_ex)
+    nest.Connect(gin,parrot_in)
+
+    # set synapse parameters:
+    syn_param_exc = {"tau_psc" :  exc_weight['Tau_psc'],
+    "tau_rec" :  exc_weight['Tau_rec'],
+    "tau_fac" :  exc_weight['Tau_fac'],
+    "U"       :  U_E,
+    "delay"   :  0.1,
+    "weight"  :  A_E,
+    "u"       :  0.0,
+    "x"       :  1.0}
+
+    syn_param_inh = {"tau_psc" :  inh_weight['Tau_psc'],
+    "tau_rec" :  inh_weight['Tau_rec'],
+    "tau_fac" :  inh_weight['Tau_fac'],
+    "U"       :  U_I,
+    "delay"   :  0.1,
+    "weight"  :  A_I,
+    "u"       :  0.0,
+    "x"       :  1.0}
+
+    syn_param_static = {'weight':Je_ext,'delay':1.0}
+
+    nest.CopyModel("tsodyks_synapse","syn_exc",syn_param_exc)
+    nest.CopyModel("tsodyks_synapse","syn_inh",syn_param_inh)
+    nest.CopyModel("static_synapse","syn_static",syn_param_static)
+
+    nest.Connect(parrot_ex, pur, syn_spec={'model':'syn_exc'}) #4.5,1.) # Exc Facil
+    nest.Connect(parrot_in, pur, syn_spec={'model':'syn_inh'}) #4.5,1.) # Inh Dep
+
+    nest.Connect(gamma_stim,pur,syn_spec={'model':'syn_static'}) # exc static
+    nest.Connect(poi,pur,syn_spec={'model':'syn_static'}) # exc static
+
+    nest.Connect(pur,sd)
+
+    if vm is not None:
+        # Voltmeter -- only a window around the stimulus, kept in memory
+        vm_start = min(gran_cell_stim[0],interneuron_stim[0]) - vm['pre']
+        vm_stop = max(gran_cell_stim[-1],interneuron_stim[-1]) + vm['post']
+        vmeter = nest.Create('multimeter',1,{'record_from':['V_m'],'interval':vm['interval'],'start':max(vm_start,0.),'stop':vm_stop,'withtime':True,'to_memory':True,'to_file':False})
+        nest.Connect(vmeter,pur[:vm['no_trial']])
+
+    # simulate
+    conn3 = nest.GetConnections(parrot_in)
+    nest.SetStatus(conn3, {"weight": A_I * 1.5})
+    nest.Simulate(sim_time)
+
+    vm_events = nest.GetStatus(vmeter,'events')[0] if vm is not None else None
+    return nest.GetStatus(sd,'events')[0], vm_events, pur[0]
+
+def run_configuration(f_name, gran_cell_stim, interneuron_stim, U_E, A_E, U_I, A_I,
+                      no_trial=200, trial_block=200, master_seed=12345, save_spikes=False,
+                      adaptive=False, adapt_metric='delta', ci_z=1.96, ci_precision=0.05, min_trial=400, max_trial=20000,
+                      stim_start=200., resp_win=100., psth_bin=5., lat_bin=0.5, lat_max=100.,
+                      vm=None, vm_store='./data/vm_traces', data_path='./data'):
+    '''
+    Simulate one configuration in blocks of trial_block trials and return its TrialStats
+
+    The kernel is reset between blocks, with its own seeds, so that the simulation time grows
+    linearly with the number of trials. With adaptive = True, blocks are simulated until the
+    half-width of the confidence interval on the mean of adapt_metric is below ci_precision
+    (after at least min_trial trials), or until max_trial trials were simulated. Otherwise
+    no_trial trials are simulated.
+    vm : None, or dict(no_trial, interval, pre, post) -- the Vm of the first block is saved in vm_store
+    '''
+    if adaptive:
+        # checked before any simulation, not after the first min_trial trials
+        if adapt_metric not in ('base', 'resp', 'delta'):
+            raise ValueError("adapt_metric must be 'base', 'resp' or 'delta', not {!r}".format(adapt_metric))
+        if min_trial > max_trial:
+            raise ValueError('min_trial ({}) is larger than max_trial ({})'.format(min_trial, max_trial))
+
+    sim_time = interneuron_stim[-1] + 300.
+    stats = TrialStats(stim_start, resp_win, sim_time, psth_bin, lat_bin, lat_max)
+
+    n_max = max_trial if adaptive else no_trial
+    kb = 0
+    while stats.no_trial < n_max: # blocks of trials
+        n_block = min(trial_block, n_max - stats.no_trial)
+        events, vm_events, first_id = simulate_block(n_block, gran_cell_stim, interneuron_stim, U_E, A_E, U_I, A_I, sim_time,
+                                                     master_seed, kb, label=f_name + '_block_' + str(kb),
+                                                     save_spikes=save_spikes, data_path=data_path, vm=vm if kb==0 else None)
+        # feed the spikes of this block to the accumulators, then forget them
+        stats.update(events['senders'], events['times'], first_id, n_block)
+        if vm_events is not None:
+            save_vm(vm_store, f_name, vm_events, vm['interval'])
+
+        kb += 1
+        if adaptive and stats.no_trial >= min_trial and getattr(stats, adapt_metric).ci(ci_z) <= ci_precision:
+            break
+
+    return stats
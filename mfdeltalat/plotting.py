@@ -0,0 +1,247 @@
+'''
+Plotting helpers for the figures of the paper
+
+matplotlib and seaborn are only imported when a figure is drawn
+'''
+import numpy as np
+
+def pyplot():
+    '''
+    matplotlib.pyplot, with fonts kept as text in the pdf
+    '''
+    import matplotlib.pyplot as plt 
+    plt.rcParams['pdf.fonttype'] = 42
+    return plt
+
+def style(font_size=None):
+    '''
+    Style of one figure, to draw (and save) it in
+    with style(7):
+    so that it does not depend on the figures drawn before -- font_size None is matplotlib's default
+    '''
+    import matplotlib
+    plt = pyplot()
+    if font_size is None:
+        font_size = matplotlib.rcParamsDefault['font.size']
+    return plt.rc_context({'font.size': font_size})
+
+def fig_1d(latencies, font_size=None):
+    '''
+    First spike latency of each rosette (left) and jitter around each rosette's mean (right)
+    latencies : dict sheet: DataFrame, as returned by data.mossy_fiber_latencies
+    '''
+    import seaborn as sn 
+    with style(font_size):
+        plt = pyplot()
+
+        centeredLatencies = []
+
+        fig,ax = plt.subplots(1,2)
+
+        lab = 1
+
+        LatenciesFromStimOnset = []
+
+        for df,color,marker in zip(latencies.values(),['red','blue','green','purple','orange'], ['o','D','s','v','^']):
+
+            firstStimLatencies = df['Stim#1']
+
+            centeredLat = df['Stim#1']-df['Stim#1'].mean()
+            centeredLatencies.append(centeredLat.values)
+            ax[1].hist(np.ravel(centeredLat), bins=np.arange(-0.15, 0.15, 0.01), color=color, alpha=0.5)
+
+            sn.swarmplot(data=firstStimLatencies,ax=ax[0],color=color,alpha=0.2,zorder=0)
+            ax[0].scatter(0,firstStimLatencies.mean(),marker=marker,color=color,zorder=1,s=40,label='Rosette_{}'.format(lab))
+            ax[0].errorbar(0,firstStimLatencies.mean(),yerr=firstStimLatencies.std(),color=color)
+
+            LatenciesFromStimOnset.append(firstStimLatencies.mean())
+
+            lab += 1 
+
+        ax[0].legend(loc='best')
+        ax[0].set_ylabel('First spike latency \nfrom stim onset [ms]')
+
+        ax[0].set_title('Avg. Lat = {} +/- {} ms'.format(round(np.nanmean(LatenciesFromStimOnset),2),
+                                                         round(np.nanstd(LatenciesFromStimOnset),2)))
+
+        finalCenteredLat = np.concatenate(centeredLatencies)
+
+        avgJitter = np.nanmean(np.abs(finalCenteredLat))
+        JitterSD = np.nanstd(finalCenteredLat)
+
+        ax[1].set_title('Avg. Jitter = {} +/- {} ms'.format(round(avgJitter,3),round(JitterSD,2)))
+        ax[1].set_xlabel('Jitter [ms]')
+        ax[1].set_ylabel('Count')
+        return fig
+
+def hist_kde(ax, single, surface, feature):
+    '''
+    Single (orange) vs surface (grey) histograms with KDE curve on top
+    '''
+    import seaborn as sn 
+
+    mergedBins = np.linspace(min(list(single)+list(surface)), max(list(single)+list(surface)), 20)
+
+    #Histogram
+    ax.hist(single, bins=mergedBins, color='orange', alpha=0.3, density=True)
+    ax.hist(surface, bins=mergedBins, color='0.5', alpha=0.3, density=True)
+
+    #KDE curve on top
+    sn.kdeplot(single,  color='orange', ax=ax)
+    sn.kdeplot(surface,  color='0.5', ax=ax)
+
+    ax.set_xlabel(feature)
+
+def fig_1e(singleData, surfaceData, font_size=7):
+    '''
+    Single vs surface distribution of each feature, with the p-value of stats.compare as title
+    '''
+    from . import stats
+    with style(font_size):
+        plt = pyplot()
+
+        fig, ax = plt.subplots(1, singleData.shape[1], figsize=(18,2))
+        fig.suptitle('Single vs Surface')
+
+        for feature, idx in zip(singleData.columns.values, range(len(singleData.columns.values))): 
+
+            single = singleData[feature].values
+            surface = surfaceData[feature].values
+
+            hist_kde(ax[idx], single, surface, feature)
+
+            #Do stats
+            pvalue = stats.compare(single, surface, feature)
+            ax[idx].set_title('p={}'.format(pvalue))
+
+        fig.tight_layout()
+        return fig
+
+def fit_mosaic(title):
+    '''
+    Single + Surface fits on the left, single and surface fits on the right
+    '''
+    plt = pyplot()
+
+    fig, ax = plt.subplot_mosaic([
+                                     ['Both', 'Single'],
+                                     ['Both', 'Surface'],
+                                     ], 
+                                 figsize=(5,4)
+                                 )
+
+    ax['Single'].set_title('Single')
+    ax['Surface'].set_title('Surface')
+    ax['Both'].set_title('Single + Surface')
+
+    fig.suptitle(title)
+    return fig, ax
+
+def plot_fit(axes, px, nom, std, color, x=None, y=None):
+    '''
+    Scatter of EPSQs vs IPSQs (if x, y are given) and linear fit +/- SD on each of axes
+    '''
+    for ax in axes:
+        if x is not None:
+            ax.scatter(x, y, color=color)
+            ax.set_xlabel('EPSQs (pC)'); ax.set_ylabel('IPSQs (pC)')
+        ax.plot(px, nom, color=color, ls='--')
+        ax.fill_between(px, nom+std, nom-std, color=color, alpha=0.2)
+
+def fit_figure(single, surface, title, font_size=7):
+    '''
+    Linear fits of IPSQs vs EPSQs for single, surface and both datasets merged
+    single, surface : [EPSQs, IPSQs]
+    '''
+    from . import stats
+
+    with style(font_size):
+        fig, ax = fit_mosaic(title)
+
+        #First the single data
+        print('    Single Data ------------')
+        px, nom, std = stats.linear_fit(single[0], single[1])
+        plot_fit([ax['Single'], ax['Both']], px, nom, std, 'tab:orange', single[0], single[1])
+
+        #Then surface data
+        print('    Surface Data ------------')
+        px, nom, std = stats.linear_fit(surface[0], surface[1])
+        plot_fit([ax['Surface'], ax['Both']], px, nom, std, '0.5', surface[0], surface[1])
+
+        #Now merge the two
+        print('   Surface + single data ------------')
+        px, nom, std = stats.linear_fit(np.concatenate((single[0],surface[0])), np.concatenate((single[1],surface[1])))
+        plot_fit([ax['Both']], px, nom, std, 'black')
+
+        fig.tight_layout()
+        return fig
+
+def fig_2ab_3abcd(singleData, surfaceData, font_size=7):
+    '''
+    Linear fits in FFI, beyond FFI and in both groups merged -> list of 3 figures
+    '''
+    figs = []
+
+    groups = [1,0]
+    groupLabels = ['FFI', 'beyond FFI']
+
+    for group, grouplabel in zip(groups, groupLabels): 
+
+        print()
+        print()
+        print('#####' + grouplabel + '#####')
+
+        single = [abs(singleData.loc[singleData['Group']==group]['EPSQ_pC'].values), abs(singleData.loc[singleData['Group']==group]['IPSQ_pC'].values)]
+        surface = [abs(surfaceData.loc[surfaceData['Group']==group]['EPSQ_pC'].values), abs(surfaceData.loc[surfaceData['Group']==group]['IPSQ_pC'].values)]
+
+        figs.append(fit_figure(single, surface, 'Linear fit - Single & Surface data in {}'.format(grouplabel), font_size))
+
+    #Merge both groups
+    print()
+    print('#####' + 'Merged Groups' + '#####')
+
+    single = [abs(singleData['EPSQ_pC'].values), abs(singleData['IPSQ_pC'].values)]
+    surface = [abs(surfaceData['EPSQ_pC'].values), abs(surfaceData['IPSQ_pC'].values)]
+
+    figs.append(fit_figure(single, surface, 'Linear fit - Single & Surface data', font_size))
+    return figs
+
+def fig_2g(single, surface, labels, font_size=7):
+    '''
+    Proportions of each group for the single and surface stimulations
+    '''
+    with style(font_size):
+        plt = pyplot()
+
+        fig, ax = plt.subplots(1,2)
+
+        ax[0].pie(single, labels=labels, autopct='%1.1f%%', startangle=90)
+        ax[0].set_title('Single stim.')
+
+        ax[1].pie(surface, labels=labels, autopct='%1.1f%%', startangle=90)
+        ax[1].set_title('Surface stim.')
+        return fig
+
+def sweep_delta_vs_delay(sweep, font_size=7):
+    '''
+    Summary of the NEST sweep (not a panel of the paper):
+    change in PC spike count (response - baseline window) vs E-I delay, averaged over the other
+    parameters, for each stimulus frequency (left) and number of stimuli (right)
+    sweep : DataFrame, as returned by data.sweep_table
+    '''
+    with style(font_size):
+        plt = pyplot()
+
+        fig, ax = plt.subplots(1,2, figsize=(6,2.5), sharey=True)
+
+        for idx, param, label in zip(range(2), ['freq', 'count'], ['{} Hz', '{} stim.']):
+            avg = sweep.groupby([param, 'delay'])['delta_mean'].mean()
+            for value in avg.index.get_level_values(0).unique():
+                ax[idx].plot(avg[value].index, avg[value].values, marker='o', ms=3, label=label.format(value))
+            ax[idx].axhline(0, color='0.5', ls='--', lw=0.5)
+            ax[idx].set_xlabel('E-I delay [ms]')
+            ax[idx].legend(loc='best', fontsize=5)
+
+        ax[0].set_ylabel('Spike count change \n(response - baseline)')
+        fig.tight_layout()
+        return fig
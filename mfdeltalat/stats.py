@@ -0,0 +1,61 @@
+'''
+Statistics used in the figures
+
+scipy and electroPyy are only imported when a test or a fit is done
+'''
+import numpy as np
+
+def compare(single, surface, label):
+    '''
+    Shapiro-Wilk on both distributions, then Levene and t-test (or Welch) if both are normal,
+    Mann-Whitney U otherwise. Prints the results and returns the p-value
+    '''
+    from scipy import stats as st
+
+    print()
+    print('----------------------------------------------')
+    print('Single vs Surface: {}'.format(label))
+    print('    single (avg +/- SD): {:.2f} +/- {:.2f}    n={}'.format(np.nanmean(single), np.nanstd(single), len(single)))
+    print('    surface (avg +/- SD): {:.2f} +/- {:.2f}    n={}'.format(np.nanmean(surface), np.nanstd(surface), len(surface)))
+
+    #Do shapiro-wilk, then leveve, and t-test if both pass. Otherwise, do MWU
+    shapiroResults = [st.shapiro(x).pvalue for x in [single, surface]]
+
+    if shapiroResults[0] < 0.05 or shapiroResults[1] < 0.05: 
+        print('     Shapiro-Wilk H0 is rejected, at least one distribution is not normal')
+
+        mwu = st.mannwhitneyu(single, surface)
+        print('     MannWhitneyU test stat = {:.3f} | p-value = {}'.format(mwu[0], mwu[1]))
+        return mwu[1]
+
+    print('     Shapiro-Wilk H0 cannot be rejected, both distributions are normal')
+
+    if st.levene(single, surface).pvalue < 0.05: 
+        print('      Levene H0 is rejected, the 2 distributions do not have equal variance')
+
+        ttest = st.ttest_ind(single, surface, equal_var=False)
+        print('      Welch test stat = {:.3f} | p-value = {}'.format(ttest[0], ttest[1]))
+
+    else: 
+        print('      Levene H0 cannot be rejected, the 2 distributions have equal variance')
+
+        ttest = st.ttest_ind(single, surface, equal_var=True)
+        print('      Ind. T-test stat = {:.3f} | p-value = {}'.format(ttest[0], ttest[1]))
+
+    return ttest[1]
+
+def linear_fit(x, y):
+    '''
+    Linear regression with 95% confidence (electroPyy), prints the stats -> px, nom, std
+    '''
+    import electroPyy
+    from scipy import stats as st
+
+    px, nom, lpb, upb, r2, std, coeffs = electroPyy.core.Regression.LinReg(x,y,
+                                                                   conf=0.95,printparams=True,
+                                                                   plot=False) 
+
+    #Do stats
+    print(st.linregress(x,y))
+    print('n={}'.format(len(x)))
+    return px, nom, std
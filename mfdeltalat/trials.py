@@ -0,0 +1,95 @@
+'''
+Streaming statistics over trials
+
+The spikes of each simulated block of neurons are fed to TrialStats, which only keeps fixed-size 
+counters, so memory does not depend on the number of trials. The statistics of a configuration 
+are saved in a .npz file, you can load them using e.g.
+xx = np.load('file_name_stats.npz')
+
+and diplay the PSTH as
+plt.bar(xx['psth_edges'][:-1],xx['psth']/(xx['no_trial']*xx['psth_bin']*1e-3),width=xx['psth_bin'],align='edge') # rate in Hz
+'''
+import numpy as np
+
+class Welford:
+    '''
+    Running mean and variance, updated with a chunk of values at a time
+    (chunks are merged with the pairwise update of Chan et al.)
+    '''
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.
+        self.m2 = 0.
+
+    def update(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.size == 0:
+            return
+        n_b, mean_b = x.size, x.mean()
+        m2_b = ((x - mean_b)**2).sum()
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta*n_b/n
+        self.m2 += m2_b + delta**2*self.n*n_b/n
+        self.n = n
+
+    @property
+    def var(self):
+        return self.m2/(self.n - 1) if self.n > 1 else np.nan
+
+    def ci(self, z=1.96):
+        '''
+        half-width of the (normal approximation) confidence interval on the mean
+        '''
+        return z*np.sqrt(self.var/self.n) if self.n > 1 else np.inf
+
+class TrialStats:
+    '''
+    Streaming statistics over trials, updated block by block with the spikes of the simulated neurons
+    Only fixed-size counters are kept, so memory does not depend on the number of trials
+    '''
+    def __init__(self, t_stim, resp_win, sim_time, psth_bin, lat_bin, lat_max):
+        self.t_stim = t_stim
+        self.resp_win = resp_win
+        self.psth_bin = psth_bin
+        self.psth_edges = np.arange(0., sim_time + psth_bin, psth_bin)
+        self.psth = np.zeros(len(self.psth_edges)-1, dtype=np.int64)
+        self.lat_edges = np.arange(0., lat_max + lat_bin, lat_bin)
+        self.lat_hist = np.zeros(len(self.lat_edges)-1, dtype=np.int64)
+        self.base = Welford() # spike count in [t_stim-resp_win, t_stim)
+        self.resp = Welford() # spike count in [t_stim, t_stim+resp_win)
+        self.delta = Welford() # resp - base, per trial
+
+    @property
+    def no_trial(self):
+        return self.base.n
+
+    def update(self, senders, times, first_id, n):
+        '''
+        senders, times : spike events of one block of n neurons, with ids first_id ... first_id+n-1
+        '''
+        trial = np.asarray(senders, dtype=np.int64) - first_id
+        times = np.asarray(times, dtype=float)
+
+        in_base = (times >= self.t_stim - self.resp_win) & (times < self.t_stim)
+        in_resp = (times >= self.t_stim) & (times < self.t_stim + self.resp_win)
+        n_base = np.bincount(trial[in_base], minlength=n)
+        n_resp = np.bincount(trial[in_resp], minlength=n)
+        self.base.update(n_base)
+        self.resp.update(n_resp)
+        self.delta.update(n_resp - n_base)
+
+        self.psth += np.histogram(times, self.psth_edges)[0]
+
+        after = times >= self.t_stim
+        first = np.full(n, np.inf)
+        np.minimum.at(first, trial[after], times[after] - self.t_stim)
+        self.lat_hist += np.histogram(first[np.isfinite(first)], self.lat_edges)[0]
+
+    def save(self, fname):
+        np.savez(fname, no_trial=self.no_trial, t_stim=self.t_stim, resp_win=self.resp_win,
+                 base_mean=self.base.mean, base_var=self.base.var,
+                 resp_mean=self.resp.mean, resp_var=self.resp.var,
+                 delta_mean=self.delta.mean, delta_var=self.delta.var,
+                 psth=self.psth, psth_edges=self.psth_edges, psth_bin=self.psth_bin,
+                 lat_hist=self.lat_hist, lat_edges=self.lat_edges)
@@ -0,0 +1,83 @@
+'''
+Float32 binary store of membrane potential traces
+
+store.bin : float32 samples, one (trials x samples) block per configuration, back to back
+store.idx : one line per configuration -> f_name, byte offset, trials, samples, first sample time, interval
+
+Several sweep processes can write to the same store: each append (samples + index line) is done 
+under an exclusive lock on store.idx
+
+You can load the traces of one configuration using e.g.
+vm, t = load_vm('./data/vm_traces', f_name)
+
+and diplay the data as
+plt.plot(t,vm.T) # this will render each trial as a trace
+'''
+import contextlib
+
+import numpy as np
+
+@contextlib.contextmanager
+def _locked(f):
+    '''
+    Exclusive lock on the open file f, for as long as the block runs
+    '''
+    try:
+        import fcntl
+    except ImportError: # Windows
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def save_vm(store, f_name, events, interval):
+    '''
+    Append the Vm samples (events of a NEST multimeter) of one configuration to the store
+    Nothing is written if no sample was recorded (no trial recorded or empty window)
+    '''
+    senders = np.asarray(events['senders'])
+    times = np.asarray(events['times'])
+    if times.size == 0:
+        print('no Vm recorded for', f_name)
+        return
+    order = np.lexsort((times, senders)) # trial by trial, in time
+    n_trial = len(np.unique(senders))
+    vm = np.asarray(events['V_m'], dtype=np.float32)[order].reshape(n_trial, -1)
+
+    # the offset is read and the index written under the same lock, so that two processes
+    # cannot get the same offset
+    with open(store + '.idx', 'a') as fi, _locked(fi):
+        with open(store + '.bin', 'ab') as fb:
+            fb.seek(0, 2)
+            offset = fb.tell()
+            vm.tofile(fb)
+        fi.write('%s %d %d %d %.17g %.17g\n' % (f_name, offset, vm.shape[0], vm.shape[1], times.min(), interval))
+
+def load_vm(store, f_name):
+    '''
+    Read back the Vm traces of one configuration from the binary store
+    returns vm (trials x samples) and the sample times t [ms]
+    '''
+    entry = None
+    with open(store + '.idx') as fi:
+        for line in fi:
+            xx = line.split()
+            if xx[0] == f_name:
+                entry = xx # if a configuration was simulated again, the last entry wins
+    if entry is None:
+        raise KeyError('no Vm recorded for ' + f_name)
+
+    offset, n_trial, n_samp = int(entry[1]), int(entry[2]), int(entry[3])
+    vm = np.fromfile(store + '.bin', dtype=np.float32, count=n_trial*n_samp, offset=offset).reshape(n_trial, n_samp)
+    t = float(entry[4]) + float(entry[5])*np.arange(n_samp)
+    return vm, t
@@ -0,0 +1,93 @@
+'''
+Incremental rebuild -- see mfdeltalat/build.py
+Only the targets that need matplotlib and pandas, and no SOURCE_DATA workbook, are built
+'''
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('pandas')
+
+from mfdeltalat import build, data, plotting
+
+figures = ['Fig_2G', 'Sweep_delta_vs_delay']
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv('MPLBACKEND', 'Agg')
+    sweep = tmp_path / 'sweep'
+    sweep.mkdir()
+    for freq in [10, 20]:
+        for delay in [-1.0, 0.0, 1.0]:
+            np.savez(str(sweep / 'neuron_Ue_0_Ae_0_Ui_0_Ai_0_freq_{}_delay_{}_count_5_stats.npz'.format(freq, delay)),
+                     no_trial=200, base_mean=1., resp_mean=2., delta_mean=delay*freq, delta_var=0.5)
+    return str(tmp_path / 'SOURCE_DATA'), str(sweep), str(tmp_path / 'figures')
+
+def rebuilt(dirs, capsys, names=figures):
+    '''
+    names of the targets made again by a new build
+    '''
+    capsys.readouterr()
+    assert build.Build(*dirs).run(names) == []
+    return sorted(line.split()[0] for line in capsys.readouterr().out.splitlines() if line.endswith('rebuilt'))
+
+def test_nothing_changed(dirs, capsys):
+    assert rebuilt(dirs, capsys) == ['Fig_2G', 'Sweep_delta_vs_delay', 'sweep']
+    assert rebuilt(dirs, capsys) == []
+
+def test_plotting_function(dirs, capsys, monkeypatch):
+    rebuilt(dirs, capsys)
+    fig_2g_old = plotting.fig_2g
+    def fig_2g(single, surface, labels, font_size=7):
+        return fig_2g_old(surface, single, labels, font_size)
+    monkeypatch.setattr(plotting, 'fig_2g', fig_2g)
+    assert rebuilt(dirs, capsys) == ['Fig_2G']
+
+def test_helper_not_listed(dirs, capsys, monkeypatch):
+    # plotting.style is only reached through the figure functions
+    rebuilt(dirs, capsys)
+    def style(font_size=None):
+        return plotting.pyplot().rc_context({'font.size': 9})
+    monkeypatch.setattr(plotting, 'style', style)
+    assert rebuilt(dirs, capsys) == ['Fig_2G', 'Sweep_delta_vs_delay']
+
+def test_constant(dirs, capsys, monkeypatch):
+    rebuilt(dirs, capsys)
+    monkeypatch.setattr(data, 'group_counts', {'single': [1,2,3,4], 'surface': [4,3,2,1]})
+    assert rebuilt(dirs, capsys) == ['Fig_2G']
+
+def test_recipe(dirs, capsys, monkeypatch):
+    rebuilt(dirs, capsys)
+    target = dict(build.targets['Fig_2G'])
+    target['make'] = lambda b: b.module('plotting').fig_2g([1,1,1,1], [2,2,2,2], b.module('data').group_labels)
+    monkeypatch.setitem(build.targets, 'Fig_2G', target)
+    assert rebuilt(dirs, capsys) == ['Fig_2G']
+
+def test_sweep_loader(dirs, capsys, monkeypatch):
+    # the rows cached by the previous build must not be reused with the new loader
+    rebuilt(dirs, capsys)
+    sweep_row = data.sweep_row
+    def new_sweep_row(fname):
+        row = sweep_row(fname)
+        row['new_column'] = 1.
+        return row
+    monkeypatch.setattr(data, 'sweep_row', new_sweep_row)
+    assert rebuilt(dirs, capsys) == ['Sweep_delta_vs_delay', 'sweep']
+    b = build.Build(*dirs)
+    assert 'new_column' in b.value('sweep').columns
+
+def test_sweep_slice(dirs, capsys):
+    rebuilt(dirs, capsys)
+    fname = dirs[1] + '/neuron_Ue_0_Ae_0_Ui_0_Ai_0_freq_10_delay_0.0_count_5_stats.npz'
+    np.savez(fname, no_trial=400, base_mean=1., resp_mean=2., delta_mean=5., delta_var=0.5)
+    assert rebuilt(dirs, capsys) == ['Sweep_delta_vs_delay', 'sweep']
+
+def test_font_size_does_not_leak(dirs, capsys):
+    import matplotlib
+    size = matplotlib.rcParams['font.size']
+    rebuilt(dirs, capsys)
+    assert matplotlib.rcParams['font.size'] == size
+
+def test_unknown_target(dirs, capsys):
+    with pytest.raises(ValueError, match='Fig_XX'):
+        rebuilt(dirs, capsys, ['Fig_2G', 'Fig_XX'])
@@ -0,0 +1,12 @@
+'''
+Import time of the package -- see mfdeltalat/importcheck.py
+'''
+import pytest
+
+from mfdeltalat import importcheck
+
+@pytest.mark.parametrize('module', importcheck.modules)
+def test_import_time(module):
+    dt, loaded = importcheck.check(module)
+    assert not loaded, '{} loads {}'.format(module, ', '.join(loaded))
+    assert dt <= importcheck.budget(module), '{} takes {:.1f} ms to import'.format(module, dt)
@@ -0,0 +1,13 @@
+'''
+Checks of the sweep options that do not need nest -- see mfdeltalat/model.py
+'''
+import pytest
+
+from mfdeltalat.model import stim_times, run_configuration
+
+@pytest.mark.parametrize('options', [dict(adapt_metric='detla'), dict(adapt_metric='psth'),
+                                     dict(min_trial=500, max_trial=400)])
+def test_adaptive_options(options):
+    gran_cell_stim, interneuron_stim = stim_times(10., 0., 5)
+    with pytest.raises(ValueError):
+        run_configuration('neuron', gran_cell_stim, interneuron_stim, 0.03, 60., 0.3, -5., adaptive=True, **options)
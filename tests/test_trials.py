@@ -0,0 +1,82 @@
+'''
+Streaming statistics over trials -- see mfdeltalat/trials.py
+'''
+import numpy as np
+
+from mfdeltalat.trials import Welford, TrialStats
+
+t_stim, resp_win, sim_time = 200., 100., 600.
+
+def fake_block(rng, n, first_id, rate=20., silent=()):
+    '''
+    Spikes of n trials (uniform in [0, sim_time)), shuffled -- the trials in silent have no spike
+    '''
+    counts = rng.poisson(rate, n)
+    counts[list(silent)] = 0
+    senders = np.repeat(np.arange(n) + first_id, counts)
+    times = rng.uniform(0., sim_time, senders.size)
+    order = rng.permutation(senders.size)
+    return senders[order], times[order]
+
+def per_trial(senders, times, first_id, n, t0, t1):
+    return np.bincount(senders[(times >= t0) & (times < t1)] - first_id, minlength=n)
+
+def test_welford_chunks():
+    x = np.random.default_rng(1).normal(3., 2., 1001)
+    w = Welford()
+    for chunk in np.split(x, [1, 7, 300, 301, 1000]):
+        w.update(chunk)
+    w.update([])
+    assert w.n == x.size
+    np.testing.assert_allclose(w.mean, np.mean(x))
+    np.testing.assert_allclose(w.var, np.var(x, ddof=1))
+    np.testing.assert_allclose(w.ci(1.96), 1.96*np.sqrt(np.var(x, ddof=1)/x.size))
+
+def test_trial_stats_blocks():
+    rng = np.random.default_rng(2)
+    stats = TrialStats(t_stim, resp_win, sim_time, psth_bin=5., lat_bin=0.5, lat_max=100.)
+
+    base, resp, n_spikes = [], [], 0
+    for n, first_id, silent in [(50, 1, (0, 49)), (50, 11, ()), (17, 3, (5,))]:
+        senders, times = fake_block(rng, n, first_id, silent=silent)
+        stats.update(senders, times, first_id, n)
+        base.append(per_trial(senders, times, first_id, n, t_stim - resp_win, t_stim))
+        resp.append(per_trial(senders, times, first_id, n, t_stim, t_stim + resp_win))
+        n_spikes += senders.size
+    base, resp = np.concatenate(base), np.concatenate(resp)
+
+    # trials without any spike count as zeros
+    assert stats.no_trial == base.size == 117
+    for w, x in [(stats.base, base), (stats.resp, resp), (stats.delta, resp - base)]:
+        np.testing.assert_allclose(w.mean, np.mean(x))
+        np.testing.assert_allclose(w.var, np.var(x, ddof=1))
+
+    # all the spikes are in [0, sim_time)
+    assert stats.psth.sum() == n_spikes
+
+def test_silent_block():
+    stats = TrialStats(t_stim, resp_win, sim_time, psth_bin=5., lat_bin=0.5, lat_max=100.)
+    stats.update(np.array([], dtype=int), np.array([]), 1, 10)
+    assert stats.no_trial == 10
+    assert stats.base.mean == stats.resp.mean == stats.delta.mean == 0.
+    assert stats.psth.sum() == 0 and stats.lat_hist.sum() == 0
+
+def test_first_spike_latency():
+    stats = TrialStats(t_stim, resp_win, sim_time, psth_bin=5., lat_bin=0.5, lat_max=100.)
+    # trial 0: first spike at 12.2 ms, trial 1: only before the stimulus, trial 2: first spike after lat_max,
+    # trial 3: first spike at 0 ms, trial 4: no spike
+    senders = np.array([10, 10, 10, 11, 12, 12, 13])
+    times = np.array([150., 230., 212.2, 100., 350., 420., 200.])
+    stats.update(senders, times, 10, 5)
+
+    assert stats.lat_hist.sum() == 2
+    assert stats.lat_hist[int(12.2/0.5)] == 1 and stats.lat_hist[0] == 1
+
+def test_psth_edges():
+    stats = TrialStats(t_stim, resp_win, sim_time, psth_bin=5., lat_bin=0.5, lat_max=100.)
+    np.testing.assert_allclose(stats.psth_edges[[0, -1]], [0., sim_time])
+    senders = np.zeros(5, dtype=int)
+    times = np.array([0., 4.9, 5., sim_time - 0.1, sim_time + 1.]) # the last one is out of range
+    stats.update(senders, times, 0, 1)
+    assert stats.psth.sum() == 4
+    assert stats.psth[0] == 2 and stats.psth[1] == 1 and stats.psth[-1] == 1
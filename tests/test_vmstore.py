@@ -0,0 +1,51 @@
+'''
+Round trip of the Vm binary store -- see mfdeltalat/vmstore.py
+'''
+import multiprocessing
+
+import numpy as np
+
+from mfdeltalat.vmstore import save_vm, load_vm
+
+def fake_events(n_trial, t0, interval, n_samp, shift=0.):
+    '''
+    Multimeter events, shuffled as NEST may return them -- V_m = 100*trial + t + shift
+    '''
+    t = t0 + interval*np.arange(n_samp)
+    senders = np.repeat(np.arange(n_trial) + 5, n_samp)
+    times = np.tile(t, n_trial)
+    order = np.random.default_rng(0).permutation(senders.size)
+    return {'senders': senders[order], 'times': times[order], 'V_m': (100.*(senders - 5) + times + shift)[order]}
+
+def test_round_trip(tmp_path):
+    store = str(tmp_path / 'vm')
+    save_vm(store, 'conf_a', fake_events(3, 150.25, 0.25, 40), 0.25)
+    save_vm(store, 'conf_b', fake_events(2, 99.7, 0.3, 25, shift=1.), 0.3)
+
+    vm, t = load_vm(store, 'conf_a')
+    assert vm.shape == (3, 40) and vm.dtype == np.float32
+    np.testing.assert_allclose(t, 150.25 + 0.25*np.arange(40))
+    np.testing.assert_allclose(vm, 100.*np.arange(3)[:, None] + t, rtol=1e-6)
+
+    vm, t = load_vm(store, 'conf_b')
+    assert vm.shape == (2, 25)
+    np.testing.assert_allclose(t, 99.7 + 0.3*np.arange(25))
+    np.testing.assert_allclose(vm, 100.*np.arange(2)[:, None] + t + 1., rtol=1e-6)
+
+def test_empty_events(tmp_path):
+    store = str(tmp_path / 'vm')
+    save_vm(store, 'conf_a', {'senders': [], 'times': [], 'V_m': []}, 0.5)
+    assert not (tmp_path / 'vm.idx').exists()
+
+def _save(args):
+    store, k = args
+    save_vm(store, 'conf_{}'.format(k), fake_events(4, 0.5, 0.5, 200, shift=k), 0.5)
+
+def test_parallel_writers(tmp_path):
+    store = str(tmp_path / 'vm')
+    with multiprocessing.Pool(4) as pool:
+        pool.map(_save, [(store, k) for k in range(16)])
+
+    for k in range(16):
+        vm, t = load_vm(store, 'conf_{}'.format(k))
+        np.testing.assert_allclose(vm, 100.*np.arange(4)[:, None] + t + k, rtol=1e-6)